@@ -25,7 +25,45 @@ from flask import current_app
 from colin_api.exceptions import BusinessNotFoundException
 from colin_api.models.corp_name import CorpName
 from colin_api.resources.db import DB
-from colin_api.utils import convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time, stringify_list
+from colin_api.utils import (bind_list, convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time,
+                             stringify_list)
+
+
+# last_ledger_timestamp: FILE event type is correct for new filings;
+# CONVOTHER is for events/filings pulled over from COBRS
+_SQL_FIND_BY_IDENTIFIER = """
+    select corp.corp_num, corp_typ_cd, recognition_dts, bn_15, can_jur_typ_cd, othr_juris_desc,
+        filing.period_end_dt, last_agm_date, corp_op_state.full_desc as state,
+        corp_state.state_typ_cd as corp_state,
+        (select max(EVENT_TIMESTMP) from EVENT
+            where EVENT_TYP_CD in ('FILE', 'CONVOTHER') and CORP_NUM = corp.corp_num
+        ) as last_ledger_timestamp
+    from CORPORATION corp
+        join CORP_STATE on CORP_STATE.corp_num = corp.corp_num and CORP_STATE.end_event_id is null
+        join CORP_OP_STATE on CORP_OP_STATE.state_typ_cd = CORP_STATE.state_typ_cd
+        left join JURISDICTION on JURISDICTION.corp_num = corp.corp_num
+        join event on corp.corp_num = event.corp_num
+        left join filing on event.event_id = filing.event_id and filing.filing_typ_cd in ('OTANN', 'ANNBC')
+    where corp_typ_cd in ({corp_type_binds}) and corp.CORP_NUM=:corp_num
+    order by filing.period_end_dt desc nulls last
+    fetch first 1 rows only
+    """
+
+# ar_filed_date is the latest event with the closest period_end_dt (2 can be filed on the same day)
+# inc_date is used for agm_date / ar_filed_date if there are no ARs with an agm for this corp
+_SQL_LAST_AR_DATES_FOR_RESET = """
+    SELECT event.corp_num,
+        MAX(event.event_timestmp) AS event_date,
+        MAX(filing.period_end_dt) AS ar_date,
+        MAX(CASE WHEN filing.period_end_dt IS NOT NULL THEN event.event_timestmp END)
+            KEEP (DENSE_RANK LAST ORDER BY filing.period_end_dt NULLS FIRST) AS ar_filed_date,
+        MAX(filing.agm_date) AS agm_date,
+        MAX(CASE WHEN filing.filing_typ_cd in ('OTINC', 'BEINC') THEN event.event_timestmp END) AS inc_date
+    FROM event
+    JOIN filing on filing.event_id = event.event_id
+    WHERE event.event_id not in ({event_id_binds}) AND event.corp_num in ({corp_num_binds})
+    GROUP BY event.corp_num
+    """
 
 
 class Business:  # pylint: disable=too-many-instance-attributes
@@ -63,20 +101,24 @@ class Business:  # pylint: disable=too-many-instance-attributes
         ]
     }
 
-    business_number = None
-    corp_name = None
-    corp_num = None
-    corp_state = None
-    corp_type = None
-    founding_date = None
-    jurisdiction = None
-    last_agm_date = None
-    last_ar_date = None
-    last_ledger_timestamp = None
-    status = None
+    __slots__ = (
+        'business_number',
+        'corp_name',
+        'corp_num',
+        'corp_state',
+        'corp_type',
+        'founding_date',
+        'jurisdiction',
+        'last_agm_date',
+        'last_ar_date',
+        'last_ledger_timestamp',
+        'status'
+    )
 
     def __init__(self):
         """Initialize with all values None."""
+        for attr in self.__slots__:
+            setattr(self, attr, None)
 
     def as_dict(self) -> Dict:
         """Return dict version of self."""
@@ -112,8 +154,9 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 """
             )
 
+            columns = [x[0].lower() for x in cursor.description]
             for row in cursor.fetchall():
-                row = dict(zip([x[0].lower() for x in cursor.description], row))
+                row = dict(zip(columns, row))
                 if row['bn_15']:
                     bn_15s[f'BC{row["corp_num"]}'] = row['bn_15']
             return bn_15s
@@ -125,47 +168,42 @@ class Business:  # pylint: disable=too-many-instance-attributes
     @classmethod
     def _get_last_ar_dates_for_reset(cls, cursor, event_info: List, event_ids: List) -> List:
         """Get the previous AR/AGM dates."""
-        events_by_corp_num = {}
-        for info in event_info:
-            if info['filing_typ_cd'] not in ['OTINC', 'BEINC'] and \
-             (info['corp_num'] not in events_by_corp_num or
-              events_by_corp_num[info['corp_num']] > info['event_id']):
-                events_by_corp_num[info['corp_num']] = info['event_id']
+        # skip incorporation events: those corps get deleted instead of reset
+        corp_nums = {info['corp_num'] for info in event_info if info['filing_typ_cd'] not in ['OTINC', 'BEINC']}
+        if not corp_nums:
+            return []
+
+        event_id_binds, event_id_values = bind_list(event_ids, 'event_id')
+        corp_num_binds, corp_num_values = bind_list(list(corp_nums), 'corp_num')
+        # aggregate the remaining events for every corp in one round trip
+        cursor.execute(
+            _SQL_LAST_AR_DATES_FOR_RESET.format(event_id_binds=event_id_binds, corp_num_binds=corp_num_binds),
+            **event_id_values,
+            **corp_num_values
+        )
+        columns = [x[0].lower() for x in cursor.description]
+        cursor.rowfactory = lambda *row: dict(zip(columns, row))
 
         dates_by_corp_num = []
-        for corp_num in events_by_corp_num:
-            cursor.execute(
-                f"""
-                SELECT event.corp_num, event.event_timestmp, filing.period_end_dt, filing.agm_date, filing.filing_typ_cd
-                FROM event
-                JOIN filing on filing.event_id = event.event_id
-                WHERE event.event_id not in ({stringify_list(event_ids)}) AND event.corp_num=:corp_num
-                ORDER BY event.event_timestmp desc
-                """,
-                corp_num=corp_num
-            )
-
-            dates = {'corp_num': corp_num}
-            for row in cursor.fetchall():
-                row = dict(zip([x[0].lower() for x in cursor.description], row))
-                if 'event_date' not in dates or dates['event_date'] < row['event_timestmp']:
-                    dates['event_date'] = row['event_timestmp']
-                # set ar_date to closest period_end_dt.
-                # this is not always the first one that gets returned if 2 were filed on the same day
-                if row['period_end_dt'] and ('ar_date' not in dates or dates['ar_date'] < row['period_end_dt']):
-                    dates['ar_date'] = row['period_end_dt']
-                    dates['ar_filed_date'] = row['event_timestmp']
-                # this may be different than ar_date if the last ar had no agm
-                if row['agm_date'] and ('agm_date' not in dates or dates['agm_date'] < row['agm_date']):
-                    dates['agm_date'] = row['agm_date']
-                # if there are no ARs for this coop then use date of incorporation
-                if row['filing_typ_cd'] in ['OTINC', 'BEINC'] and 'agm_date' not in dates:
-                    dates['agm_date'] = row['event_timestmp']
-                    dates['ar_filed_date'] = row['event_timestmp']
+        for dates in cursor.fetchall():
+            # if there are no ARs with an agm for this corp then use date of incorporation
+            inc_date = dates.pop('inc_date')
+            if not dates['agm_date'] and inc_date:
+                dates['agm_date'] = inc_date
+                dates['ar_filed_date'] = inc_date
 
             dates_by_corp_num.append(dates)
         return dates_by_corp_num
 
+    @classmethod
+    def _get_jurisdiction(cls, business: Dict) -> str:
+        """Return the jurisdiction for the corporation record: XPROs have their own; otherwise, it's BC."""
+        if business['corp_typ_cd'] != 'XCP':
+            return 'BC'
+        if business['can_jur_typ_cd'] == 'OT':
+            return business['othr_juris_desc']
+        return business['can_jur_typ_cd']
+
     @classmethod
     def find_by_identifier(cls, identifier: str, corp_types: List, con=None) -> Business:
         """Return a Business by identifier."""
@@ -176,30 +214,21 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 con = DB.connection
                 con.begin()
 
+            corp_type_binds, corp_type_values = bind_list(corp_types, 'corp_type')
             cursor = con.cursor()
             cursor.execute(
-                f"""
-                select corp.corp_num, corp_typ_cd, recognition_dts, bn_15, can_jur_typ_cd, othr_juris_desc,
-                    filing.period_end_dt, last_agm_date, corp_op_state.full_desc as state,
-                    corp_state.state_typ_cd as corp_state
-                from CORPORATION corp
-                    join CORP_STATE on CORP_STATE.corp_num = corp.corp_num and CORP_STATE.end_event_id is null
-                    join CORP_OP_STATE on CORP_OP_STATE.state_typ_cd = CORP_STATE.state_typ_cd
-                    left join JURISDICTION on JURISDICTION.corp_num = corp.corp_num
-                    join event on corp.corp_num = event.corp_num
-                    left join filing on event.event_id = filing.event_id and filing.filing_typ_cd in ('OTANN', 'ANNBC')
-                where corp_typ_cd in ({stringify_list(corp_types)}) and corp.CORP_NUM=:corp_num
-                order by filing.period_end_dt desc nulls last
-                """,
-                corp_num=identifier
+                _SQL_FIND_BY_IDENTIFIER.format(corp_type_binds=corp_type_binds),
+                corp_num=identifier,
+                **corp_type_values
             )
+            # add column names to resultset to build out correct json structure and make manipulation below more robust
+            # (better than column numbers). The row factory is reset on the next execute.
+            columns = [x[0].lower() for x in cursor.description]
+            cursor.rowfactory = lambda *row: dict(zip(columns, row))
             business = cursor.fetchone()
             if not business:
                 raise BusinessNotFoundException(identifier=identifier)
 
-            # add column names to resultset to build out correct json structure and make manipulation below more robust
-            # (better than column numbers)
-            business = dict(zip([x[0].lower() for x in cursor.description], business))
             # get all assumed, numbered/corporation, translation names
             corp_names = CorpName.get_current(cursor=cursor, corp_num=identifier)
             assumed_name = None
@@ -211,37 +240,17 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 elif name_obj.type_code in [CorpName.TypeCodes.CORP.value, CorpName.TypeCodes.NUMBERED_CORP.value]:
                     corp_name = name_obj.corp_name
 
-            # get last ledger date from EVENT table and add to business record
-            # note - FILE event type is correct for new filings; CONVOTHER is for events/filings pulled over from COBRS
-            cursor.execute(
-                """
-                select max(EVENT_TIMESTMP) from EVENT
-                where EVENT_TYP_CD in ('FILE', 'CONVOTHER') and CORP_NUM=:corp_num
-                """,
-                corp_num=identifier
-            )
-            last_ledger_timestamp = cursor.fetchone()[0]
-            business['last_ledger_timestamp'] = last_ledger_timestamp
-            # if this is an XPRO, get correct jurisdiction; otherwise, it's BC
-            if business['corp_typ_cd'] == 'XCP':
-                business['jurisdiction'] = business['can_jur_typ_cd']
-                if business['can_jur_typ_cd'] == 'OT':
-                    business['jurisdiction'] = business['othr_juris_desc']
-            else:
-                business['jurisdiction'] = 'BC'
-
             # convert to Business object
             business_obj = Business()
             business_obj.business_number = business['bn_15']
-            business_obj.corp_name = assumed_name if assumed_name else corp_name
+            business_obj.corp_name = assumed_name or corp_name
             business_obj.corp_num = business['corp_num']
             business_obj.corp_state = business['corp_state']
             business_obj.corp_type = business['corp_typ_cd']
             business_obj.founding_date = convert_to_json_datetime(business['recognition_dts'])
-            business_obj.jurisdiction = business['jurisdiction']
+            business_obj.jurisdiction = cls._get_jurisdiction(business)
             business_obj.last_agm_date = convert_to_json_date(business['last_agm_date'])
-            business_obj.last_ar_date = convert_to_json_date(business['period_end_dt']) if business['period_end_dt'] \
-                else convert_to_json_date(business['last_agm_date'])
+            business_obj.last_ar_date = convert_to_json_date(business['period_end_dt'] or business['last_agm_date'])
             business_obj.last_ledger_timestamp = convert_to_json_datetime(business['last_ledger_timestamp'])
             business_obj.status = business['state']
 
@@ -249,7 +258,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
 
         except Exception as err:
             # general catch-all exception
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to find business {identifier}')
 
             # pass through exception to caller
             raise err
@@ -325,7 +334,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 value=value
             )
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to create corp restriction for {corp_num}')
             raise err
 
     @classmethod
@@ -392,7 +401,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 return dict(zip([x[0].lower() for x in description], restrictions[0]))
             return False
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to get corp restriction for {corp_num}')
             raise err
 
     @classmethod
@@ -409,7 +418,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 corp_num=corp_num
             )
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to end corp restriction for {corp_num}')
             raise err
 
     @classmethod
@@ -449,7 +458,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 )
 
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to update corporation {corp_num}')
             raise err
 
     @classmethod
@@ -467,7 +476,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
             )
 
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to end corp state for {corp_num}')
             raise err
         try:
             cursor.execute(
@@ -481,7 +490,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
             )
 
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to insert corp state for {corp_num}')
             raise err
 
     @classmethod
@@ -503,7 +512,7 @@ class Business:  # pylint: disable=too-many-instance-attributes
             )
 
         except Exception as err:
-            current_app.logger.error(err.with_traceback(None))
+            current_app.logger.exception(f'Error in Business: Failed to update corp type for {corp_num}')
             raise err
 
     @classmethod
@@ -580,23 +589,31 @@ class Business:  # pylint: disable=too-many-instance-attributes
             return
 
         dates_by_corp_num = cls._get_last_ar_dates_for_reset(cursor=cursor, event_info=event_info, event_ids=event_ids)
-        for item in dates_by_corp_num:
-            try:
-                cursor.execute(
-                    """
-                    UPDATE corporation
-                    SET LAST_AR_FILED_DT = :ar_filed_date, LAST_AGM_DATE = :agm_date, LAST_LEDGER_DT = :event_date
-                    WHERE corp_num = :corp_num
-                    """,
-                    agm_date=item['agm_date'] if item['agm_date'] else item['ar_date'],
-                    ar_filed_date=item['ar_filed_date'],
-                    event_date=item['event_date'],
-                    corp_num=item['corp_num']
-                )
+        if not dates_by_corp_num:
+            return
+
+        try:
+            cursor.executemany(
+                """
+                UPDATE corporation
+                SET LAST_AR_FILED_DT = :ar_filed_date, LAST_AGM_DATE = :agm_date, LAST_LEDGER_DT = :event_date
+                WHERE corp_num = :corp_num
+                """,
+                [
+                    {
+                        'agm_date': item['agm_date'] or item['ar_date'],
+                        'ar_filed_date': item['ar_filed_date'],
+                        'event_date': item['event_date'],
+                        'corp_num': item['corp_num']
+                    }
+                    for item in dates_by_corp_num
+                ]
+            )
 
-            except Exception as err:
-                current_app.logger.error(f'Error in Business: Failed to reset corporation for {item["corp_num"]}')
-                raise err
+        except Exception as err:
+            corp_nums = [item['corp_num'] for item in dates_by_corp_num]
+            current_app.logger.error(f'Error in Business: Failed to reset corporations for {corp_nums}')
+            raise err
 
     @classmethod
     def reset_corp_states(cls, cursor, event_ids: List):
@@ -604,13 +621,15 @@ class Business:  # pylint: disable=too-many-instance-attributes
         if not event_ids:
             return
 
+        event_id_binds, event_id_values = bind_list(event_ids, 'event_id')
         # delete corp_state rows created on these events
         try:
             cursor.execute(
                 f"""
                 DELETE FROM corp_state
-                WHERE start_event_id in ({stringify_list(event_ids)})
-                """
+                WHERE start_event_id in ({event_id_binds})
+                """,
+                **event_id_values
             )
         except Exception as err:
             current_app.logger.error(f'Error in Business: Failed delete corp_state rows for events {event_ids}')
@@ -622,8 +641,9 @@ class Business:  # pylint: disable=too-many-instance-attributes
                 f"""
                 UPDATE corp_state
                 SET end_event_id = null
-                WHERE end_event_id in ({stringify_list(event_ids)})
-                """
+                WHERE end_event_id in ({event_id_binds})
+                """,
+                **event_id_values
             )
         except Exception as err:
             current_app.logger.error(f'Error in Business: Failed reset ended corp_state rows for events {event_ids}')
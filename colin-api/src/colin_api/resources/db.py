@@ -57,7 +57,7 @@ class OracleDB:
         def init_session(conn, *args):  # pylint: disable=unused-argument; Extra var being passed with call
             cursor = conn.cursor()
             cursor.execute("alter session set TIME_ZONE = 'America/Vancouver'")
-        return cx_Oracle.SessionPool(user=current_app.config.get('ORACLE_USER'),  # pylint:disable=c-extension-no-member
+        pool = cx_Oracle.SessionPool(user=current_app.config.get('ORACLE_USER'),  # pylint:disable=c-extension-no-member
                                      password=current_app.config.get('ORACLE_PASSWORD'),
                                      dsn='{0}:{1}/{2}'.format(current_app.config.get('ORACLE_HOST'),
                                                               current_app.config.get('ORACLE_PORT'),
@@ -73,6 +73,7 @@ class OracleDB:
                                      sessionCallback=init_session,
                                      encoding='UTF-8',
                                      nencoding='UTF-8')
+        return pool
 
     @property
     def connection(self):  # pylint: disable=inconsistent-return-statements
@@ -13,11 +13,15 @@
 # limitations under the License.
 """Time conversion methods."""
 import datetime
+from typing import Dict, Tuple
 
 from flask import current_app
 from pytz import timezone
 
 
+UTC = timezone('UTC')
+
+
 def convert_to_json_date(thedate: datetime.datetime) -> str:
     """Convert datetime to string formatted as YYYY-MM-DD, per JSON Schema specs."""
     if not thedate:
@@ -34,10 +38,8 @@ def convert_to_json_datetime(thedate: datetime.datetime) -> str:
     if not thedate:
         return None
     try:
-        # timezone info not in var (they are pacififc times so add timezone)
-        thedate = thedate.astimezone(timezone('US/Pacific'))
-        # convert to utc time
-        thedate = thedate.astimezone(timezone('UTC'))
+        # timezone info not in var (they are pacific times, same as local): convert straight to utc time
+        thedate = thedate.astimezone(UTC)
         # return as string
         return thedate.strftime('%Y-%m-%dT%H:%M:%S-00:00')
     except Exception as err:  # pylint: disable=broad-except; want to return None in all cases where convert failed
@@ -72,6 +74,15 @@ def stringify_list(list_orig: list) -> str:
     return list_str
 
 
+def bind_list(list_orig: list, prefix: str = 'item') -> Tuple[str, Dict]:
+    """Return the bind placeholders and bind values of the given list for sql query IN clauses.
+
+    Binding the values keeps the sql text the same for lists of the same length so oracle can reuse the statement.
+    """
+    binds = {f'{prefix}_{index}': item for index, item in enumerate(list_orig)}
+    return ', '.join(f':{name}' for name in binds), binds
+
+
 def delete_from_table_by_event_ids(cursor, event_ids: list, table: str, column: str = 'start_event_id'):
     """Delete rows with given event ids from given table."""
     try:
@@ -0,0 +1,45 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the bind_list utility.
+
+Test-Suite to ensure that the sql bind placeholders and values are built as expected.
+"""
+import pytest
+
+from colin_api.utils import bind_list
+
+
+@pytest.mark.parametrize('list_orig,prefix,expected_placeholders,expected_binds', [
+    (['BC0000001', 'BC0000002'], 'corp_num', ':corp_num_0, :corp_num_1',
+     {'corp_num_0': 'BC0000001', 'corp_num_1': 'BC0000002'}),
+    (['BEN'], 'corp_type', ':corp_type_0', {'corp_type_0': 'BEN'}),
+    ([10, 20, 30], 'item', ':item_0, :item_1, :item_2', {'item_0': 10, 'item_1': 20, 'item_2': 30}),
+])
+def test_bind_list(list_orig, prefix, expected_placeholders, expected_binds):
+    """Assert that each value gets a named placeholder and is mapped to it in the binds."""
+    placeholders, binds = bind_list(list_orig, prefix)
+
+    assert placeholders == expected_placeholders
+    assert binds == expected_binds
+
+
+def test_bind_list_default_prefix():
+    """Assert that the placeholders use the item prefix by default."""
+    assert bind_list(['a']) == (':item_0', {'item_0': 'a'})
+
+
+def test_bind_list_empty():
+    """Assert that an empty list gives no placeholders and no binds."""
+    assert bind_list([]) == ('', {})
@@ -236,9 +236,9 @@ class Filing:
         return None
 
     @staticmethod
-    def get_filings_by_status(business_id: int, status: [], after_date: date = None):
+    def get_filings_by_status(business_id: int, status: [], after_date: date = None, with_json: bool = False):
         """Return the filings with statuses in the status array input."""
-        storages = FilingStorage.get_filings_by_status(business_id, status, after_date)
+        storages = FilingStorage.get_filings_by_status(business_id, status, after_date, with_json)
         filings = []
         for storage in storages:
             filing = Filing()
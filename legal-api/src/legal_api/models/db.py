@@ -15,13 +15,19 @@
 
 These will get initialized by the application using the models
 """
+import orjson
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy_continuum import make_versioned
 
 
+def json_serializer(obj) -> str:
+    """Serialize the JSON columns with orjson, the engine expects a str back."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')  # pylint: disable=no-member
+
+
 # by convention in the Flask community these are lower case,
 # whereas pylint wants them upper case
-db = SQLAlchemy()  # pylint: disable=invalid-name
+db = SQLAlchemy(engine_options={'json_serializer': json_serializer})  # pylint: disable=invalid-name
 
 # make_versioned(user_cls=None, plugins=[FlaskPlugin()])
 make_versioned(user_cls=None)
@@ -20,10 +20,12 @@ from typing import Tuple, Union
 
 import requests  # noqa: I001; grouping out of order to make both pylint & isort happy
 from requests import exceptions  # noqa: I001; grouping out of order to make both pylint & isort happy
-from flask import current_app, g, jsonify, request
+from requests.adapters import HTTPAdapter  # noqa: I001; grouping out of order to make both pylint & isort happy
+from flask import current_app, g, request
 from flask_babel import _
 from flask_jwt_oidc import JwtManager
 from flask_restx import Resource, cors
+from sqlalchemy import text
 from werkzeug.local import LocalProxy
 
 import legal_api.reports
@@ -47,12 +49,34 @@ from legal_api.services.utils import get_str
 from legal_api.utils import datetime
 from legal_api.utils.auth import jwt
 from legal_api.utils.legislation_datetime import LegislationDatetime
+from legal_api.utils.orjson_response import ojsonify
 from legal_api.utils.util import cors_preflight
 
 from .api_namespace import API
 # noqa: I003; the multiple route decorators cause an erroneous error in line space counting
 
 
+LAST_COLIN_EVENT_ID_SQL = text(
+    """
+    select last_event_id from colin_last_update
+    order by id desc
+    limit 1
+    """
+)
+
+INSERT_COLIN_LAST_UPDATE_SQL = text(
+    """
+    insert into colin_last_update (last_update, last_event_id)
+    values (current_timestamp, :colin_id)
+    """
+)
+
+# keep-alive connections to the payment service, reused across requests
+PAY_SESSION = requests.Session()
+PAY_SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+PAY_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+
 @cors_preflight('GET, POST, PUT, DELETE, PATCH')
 @API.route('/<string:identifier>/filings', methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])
 @API.route('/<string:identifier>/filings/<int:filing_id>', methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS', 'PATCH'])
@@ -70,7 +94,7 @@ class ListFilingResource(Resource):
             rv = CoreFiling.get(identifier, filing_id)
 
             if not rv.storage:
-                return jsonify({'message': f'{identifier} no filings found'}), HTTPStatus.NOT_FOUND
+                return ojsonify({'message': f'{identifier} no filings found'}), HTTPStatus.NOT_FOUND
             if str(request.accept_mimetypes) == 'application/pdf' and filing_id:
                 if rv.filing_type == 'incorporationApplication':
                     return legal_api.reports.get_pdf(rv.storage, None)
@@ -88,9 +112,10 @@ class ListFilingResource(Resource):
                         'Content-Type': 'application/json'
                     }
                     payment_svc_url = current_app.config.get('PAYMENT_SVC_URL')
-                    pay_response = requests.get(
+                    pay_response = PAY_SESSION.get(
                         url=f'{payment_svc_url}/{filing_json["filing"]["header"]["paymentToken"]}',
-                        headers=headers
+                        headers=headers,
+                        timeout=20.0
                     )
                     pay_details = {
                         'isPaymentActionRequired': pay_response.json().get('isPaymentActionRequired', False),
@@ -102,17 +127,17 @@ class ListFilingResource(Resource):
                     current_app.logger.error(
                         f'Payment connection failure for getting {identifier} filing payment details. ', err)
 
-            return jsonify(filing_json)
+            return ojsonify(filing_json)
 
         business = Business.find_by_identifier(identifier)
 
         if not business:
-            return jsonify(filings=[]), HTTPStatus.NOT_FOUND
+            return ojsonify(filings=[]), HTTPStatus.NOT_FOUND
 
         if filing_id:
             rv = CoreFiling.get(identifier, filing_id)
             if not rv:
-                return jsonify({'message': f'{identifier} no filings found'}), HTTPStatus.NOT_FOUND
+                return ojsonify({'message': f'{identifier} no filings found'}), HTTPStatus.NOT_FOUND
 
             if str(request.accept_mimetypes) == 'application/pdf':
                 report_type = request.args.get('type', None)
@@ -122,22 +147,22 @@ class ListFilingResource(Resource):
                     rv.storage._filing_json['filing']['correction']['diff'] = rv.json['filing']['correction']['diff']  # pylint: disable=protected-access; # noqa: E501;
 
                 return legal_api.reports.get_pdf(rv.storage, report_type)
-            return jsonify(rv.raw if original_filing else rv.json)
+            return ojsonify(rv.raw if original_filing else rv.json)
 
         # Does it make sense to get a PDF of all filings?
         if str(request.accept_mimetypes) == 'application/pdf':
-            return jsonify({'message': _('Cannot return a single PDF of multiple filing submissions.')}),\
+            return ojsonify({'message': _('Cannot return a single PDF of multiple filing submissions.')}),\
                 HTTPStatus.NOT_ACCEPTABLE
 
-        rv = []
-        filings = CoreFiling.get_filings_by_status(business.id,
-                                                   [Filing.Status.COMPLETED.value, Filing.Status.PAID.value])
-        for filing in filings:
-            filing_json = filing.raw
-            filing_json['filing']['documents'] = DocumentMetaService().get_documents(filing_json)
-            rv.append(filing_json)
+        rv = [filing.raw for filing in
+              CoreFiling.get_filings_by_status(business.id,
+                                               [Filing.Status.COMPLETED.value, Filing.Status.PAID.value],
+                                               with_json=True)]
+        document_meta = DocumentMetaService(business)
+        for filing_json in rv:
+            filing_json['filing']['documents'] = document_meta.get_documents(filing_json)
 
-        return jsonify(filings=rv)
+        return ojsonify(filings=rv)
 
     @staticmethod
     @cors.crossdomain(origin='*')
@@ -154,12 +179,12 @@ class ListFilingResource(Resource):
         # basic checks
         err_msg, err_code = ListFilingResource._put_basic_checks(identifier, filing_id, request)
         if err_msg:
-            return jsonify({'errors': [err_msg, ]}), err_code
+            return ojsonify({'errors': [err_msg, ]}), err_code
         json_input = request.get_json()
 
         # check authorization
         if not authorized(identifier, jwt, action=['edit']):
-            return jsonify({'message':
+            return ojsonify({'message':
                             f'You are not authorized to submit a filing for {identifier}.'}), \
                 HTTPStatus.UNAUTHORIZED
 
@@ -172,29 +197,32 @@ class ListFilingResource(Resource):
         # get header params
         payment_account_id = request.headers.get('accountId', None)
 
+        # look up the business once, it is used by both the validation and the save
+        business = None if identifier.startswith('T') else Business.find_by_identifier(identifier)
+
         # validate filing
-        if not draft and not ListFilingResource._is_before_epoch_filing(json_input,
-                                                                        Business.find_by_identifier(identifier)):
+        if not draft and not ListFilingResource._is_before_epoch_filing(json_input, business):
             if identifier.startswith('T'):
                 business_validate = RegistrationBootstrap.find_by_identifier(identifier)
             else:
-                business_validate = Business.find_by_identifier(identifier)
+                business_validate = business
             err = validate(business_validate, json_input)
             # err_msg, err_code = ListFilingResource._validate_filing_json(request)
             if err or only_validate:
                 if err:
                     json_input['errors'] = err.msg
-                    return jsonify(json_input), err.code
-                return jsonify(json_input), HTTPStatus.OK
+                    return ojsonify(json_input), err.code
+                return ojsonify(json_input), HTTPStatus.OK
 
         # save filing, if it's draft only then bail
         user = User.get_or_create_user_by_jwt(g.jwt_oidc_token_info)
         try:
-            business, filing, err_msg, err_code = ListFilingResource._save_filing(request, identifier, user, filing_id)
+            business, filing, err_msg, err_code = ListFilingResource._save_filing(request, identifier, user, filing_id,
+                                                                                  business)
             if err_msg or draft:
                 reply = filing.json if filing else json_input
                 reply['errors'] = [err_msg, ]
-                return jsonify(reply), err_code or \
+                return ojsonify(reply), err_code or \
                     (HTTPStatus.CREATED if (request.method == 'POST') else HTTPStatus.ACCEPTED)
         except Exception as err:
             print(err)
@@ -208,7 +236,7 @@ class ListFilingResource(Resource):
         filing_json = filing.json
         if response:
             filing_json['filing']['header'].update(response)
-        return jsonify(filing_json),\
+        return ojsonify(filing_json),\
             (HTTPStatus.CREATED if (request.method == 'POST') else HTTPStatus.ACCEPTED)
 
     @staticmethod
@@ -223,7 +251,7 @@ class ListFilingResource(Resource):
 
         # check authorization
         if not authorized(identifier, jwt, action=['edit']):
-            return jsonify({'message':
+            return ojsonify({'message':
                             _('You are not authorized to delete a filing for:') + identifier}),\
                 HTTPStatus.UNAUTHORIZED
 
@@ -233,12 +261,12 @@ class ListFilingResource(Resource):
             filing = Business.get_filing_by_id(identifier, filing_id)
 
         if not filing:
-            return jsonify({'message': _('Filing Not Found.')}), HTTPStatus.NOT_FOUND
+            return ojsonify({'message': _('Filing Not Found.')}), HTTPStatus.NOT_FOUND
 
         try:
             filing.delete()
         except BusinessException as err:
-            return jsonify({'errors': [{'error': err.error}, ]}), err.status_code
+            return ojsonify({'errors': [{'error': err.error}, ]}), err.status_code
 
         if identifier.startswith('T'):
             bootstrap = RegistrationBootstrap.find_by_identifier(identifier)
@@ -248,7 +276,7 @@ class ListFilingResource(Resource):
                 if deregister_status != HTTPStatus.OK or delete_status != HTTPStatus.OK:
                     current_app.logger.error('Unable to deregister and delete temp reg:', identifier)
 
-        return jsonify({'message': _('Filing deleted.')}), HTTPStatus.OK
+        return ojsonify({'message': _('Filing deleted.')}), HTTPStatus.OK
 
     @staticmethod
     @cors.crossdomain(origin='*')
@@ -262,7 +290,7 @@ class ListFilingResource(Resource):
 
         # check authorization
         if not authorized(identifier, jwt, action=['edit']):
-            return jsonify({'message':
+            return ojsonify({'message':
                             _('You are not authorized to delete a filing for:') + identifier}), \
                 HTTPStatus.UNAUTHORIZED
 
@@ -276,14 +304,14 @@ class ListFilingResource(Resource):
             filing = Business.get_filing_by_id(identifier, filing_id)
 
         if not filing:
-            return jsonify({'message': ('Filing Not Found.')}), \
+            return ojsonify({'message': ('Filing Not Found.')}), \
                 HTTPStatus.NOT_FOUND
 
         try:
             payment_svc_url = '{}/{}'.format(current_app.config.get('PAYMENT_SVC_URL'), filing.payment_token)
             token = jwt.get_token_auth_header()
             headers = {'Authorization': 'Bearer ' + token}
-            rv = requests.delete(url=payment_svc_url, headers=headers, timeout=20.0)
+            rv = PAY_SESSION.delete(url=payment_svc_url, headers=headers, timeout=20.0)
             if rv.status_code == HTTPStatus.OK or rv.status_code == HTTPStatus.ACCEPTED:
                 filing.reset_filing_to_draft()
 
@@ -296,7 +324,7 @@ class ListFilingResource(Resource):
         except BusinessException as err:
             return {'errors': [{'message': err.error}]}, err.status_code
 
-        return jsonify(filing.json), HTTPStatus.ACCEPTED
+        return ojsonify(filing.json), HTTPStatus.ACCEPTED
 
     @staticmethod
     def _check_and_update_nr(filing):
@@ -322,7 +350,7 @@ class ListFilingResource(Resource):
         # if filing is from COLIN, place on queue and return
         if filing.source == Filing.Source.COLIN.value:
             err_msg, err_code = ListFilingResource._process_colin_filing(business.identifier, filing, business)
-            return jsonify(err_msg), err_code
+            return ojsonify(err_msg), err_code
 
         # create invoice
         if not draft:
@@ -338,8 +366,13 @@ class ListFilingResource(Resource):
             if pay_msg and pay_code != HTTPStatus.CREATED:
                 reply = filing.json
                 reply['errors'] = [pay_msg, ]
-                return jsonify(reply), pay_code
-            ListFilingResource._set_effective_date(business, filing)
+                return ojsonify(reply), pay_code
+            # the payment details and the effective date are committed together,
+            # the invoice exists in pay so its token is committed even if setting the date fails
+            try:
+                ListFilingResource._set_effective_date(business, filing)
+            finally:
+                filing.save()
             return pay_msg, pay_code
 
         return None, None
@@ -398,10 +431,12 @@ class ListFilingResource(Resource):
     def _save_filing(client_request: LocalProxy,  # pylint: disable=too-many-return-statements,too-many-branches
                      business_identifier: str,
                      user: User,
-                     filing_id: int) -> Tuple[Union[Business, RegistrationBootstrap], Filing, dict, int]:
+                     filing_id: int,
+                     business: Business = None) -> Tuple[Union[Business, RegistrationBootstrap], Filing, dict, int]:
         """Save the filing to the ledger.
 
         If not successful, a dict of errors is returned.
+        The business is looked up by identifier when it hasn't already been loaded by the caller.
 
         Returns: {
             Business: business model object found for the identifier provided
@@ -443,21 +478,19 @@ class ListFilingResource(Resource):
 
         else:
             # regular filing for a business
-            business = Business.find_by_identifier(business_identifier)
+            business = business or Business.find_by_identifier(business_identifier)
             if not business:
                 return None, None, {'message':
                                     f'{business_identifier} not found'}, HTTPStatus.NOT_FOUND
 
             if client_request.method == 'PUT':
-                rv = db.session.query(Business, Filing). \
-                    filter(Business.id == Filing.business_id). \
-                    filter(Business.identifier == business_identifier). \
+                filing = db.session.query(Filing). \
+                    filter(Filing.business_id == business.id). \
                     filter(Filing.id == filing_id). \
                     one_or_none()
-                if not rv:
+                if not filing:
                     return None, None, {'message':
                                         f'{business_identifier} no filings found'}, HTTPStatus.NOT_FOUND
-                filing = rv[1]
             else:
                 filing = Filing()
                 filing.business_id = business.id
@@ -520,6 +553,7 @@ class ListFilingResource(Resource):
         """
         filing_types = []
         priority_flag = filing_json['filing']['header'].get('priority', False)
+        waive_fees = filing_json['filing']['header'].get('waiveFees', False)
         filing_type = filing_json['filing']['header'].get('name', None)
         if filing_type == 'incorporationApplication':
             legal_type = filing_json['filing']['business']['legalType']
@@ -532,11 +566,12 @@ class ListFilingResource(Resource):
             filing_types.append({
                 'filingTypeCode': filing_type_code,
                 'priority': priority_flag,
-                'waiveFees': filing_json['filing']['header'].get('waiveFees', False)
+                'waiveFees': waive_fees
             })
         else:
             for k in filing_json['filing'].keys():
-                filing_type_code = Filing.FILINGS.get(k, {}).get('codes', {}).get(legal_type)
+                filing_meta = Filing.FILINGS.get(k, {})
+                filing_type_code = filing_meta.get('codes', {}).get(legal_type)
                 priority = priority_flag
 
                 # check if changeOfDirectors is a free filing
@@ -548,8 +583,8 @@ class ListFilingResource(Resource):
                         if not all(change in free_changes for change in director.get('actions', [])):
                             free = False
                             break
-                    filing_type_code = Filing.FILINGS[k].get('free', {}).get('codes', {}).get(legal_type)\
-                        if free else Filing.FILINGS[k].get('codes', {}).get(legal_type)
+                    if free:
+                        filing_type_code = filing_meta.get('free', {}).get('codes', {}).get(legal_type)
 
                 # check if priority handled in parent filing
                 if k in ['changeOfDirectors', 'changeOfAddress']:
@@ -564,7 +599,7 @@ class ListFilingResource(Resource):
                     filing_types.append({
                         'filingTypeCode': filing_type_code,
                         'priority': priority,
-                        'waiveFees': filing_json['filing']['header'].get('waiveFees', False)
+                        'waiveFees': waive_fees
                     })
         return filing_types
 
@@ -639,30 +674,31 @@ class ListFilingResource(Resource):
             token = user_jwt.get_token_auth_header()
             headers = {'Authorization': 'Bearer ' + token,
                        'Content-Type': 'application/json'}
-            rv = requests.post(url=payment_svc_url,
-                               json=payload,
-                               headers=headers,
-                               timeout=20.0)
+            rv = PAY_SESSION.post(url=payment_svc_url,
+                                  json=payload,
+                                  headers=headers,
+                                  timeout=20.0)
         except (exceptions.ConnectionError, exceptions.Timeout) as err:
             current_app.logger.error(f'Payment connection failure for {business.identifier}: filing:{filing.id}', err)
             return {'message': 'unable to create invoice for payment.'}, HTTPStatus.PAYMENT_REQUIRED
 
         if rv.status_code == HTTPStatus.OK or rv.status_code == HTTPStatus.CREATED:
-            pid = rv.json().get('id')
-            filing.payment_token = pid
-            filing.payment_status_code = rv.json().get('statusCode', '')
+            invoice = rv.json()
+            filing.payment_token = invoice.get('id')
+            filing.payment_status_code = invoice.get('statusCode', '')
             filing.payment_account = payment_account_id
-            filing.save()
-            return {'isPaymentActionRequired': rv.json().get('isPaymentActionRequired', False)}, HTTPStatus.CREATED
+            filing.save_to_session()  # committed by the caller once the effective date is set
+            return {'isPaymentActionRequired': invoice.get('isPaymentActionRequired', False)}, HTTPStatus.CREATED
 
         if rv.status_code == HTTPStatus.BAD_REQUEST:
             # Set payment error type used to retrieve error messages from pay-api
-            error_type = rv.json().get('type')
+            pay_error = rv.json()
+            error_type = pay_error.get('type')
             filing.payment_status_code = error_type
             filing.save()
 
             return {'payment_error_type': error_type,
-                    'message': rv.json().get('detail')}, HTTPStatus.PAYMENT_REQUIRED
+                    'message': pay_error.get('detail')}, HTTPStatus.PAYMENT_REQUIRED
 
         return {'message': 'unable to create invoice for payment.'}, HTTPStatus.PAYMENT_REQUIRED
 
@@ -673,14 +709,12 @@ class ListFilingResource(Resource):
             fe_date = filing.filing_json['filing']['header'].get('futureEffectiveDate')
             if fe_date:
                 filing.effective_date = datetime.datetime.fromisoformat(fe_date)
-                filing.save()
 
         elif business.legal_type != 'CP':
             if filing_type == 'changeOfAddress':
                 effective_date = LegislationDatetime.tomorrow_midnight()
                 filing.filing_json['filing']['header']['futureEffectiveDate'] = effective_date
                 filing.effective_date = effective_date
-                filing.save()
 
     @staticmethod
     def _is_future_effective_filing(filing_json: dict) -> bool:
@@ -725,12 +759,12 @@ class InternalFilings(Resource):
                             continue
                         filing_json['filing']['correction']['correctedFilingColinId'] = colin_ids[0]  # should only be 1
                     filings.append(filing_json)
-            return jsonify(filings), HTTPStatus.OK
+            return ojsonify(filings), HTTPStatus.OK
 
         pending_filings = Filing.get_all_filings_by_status(status)
         for filing in pending_filings:
             filings.append(filing.json)
-        return jsonify(filings), HTTPStatus.OK
+        return ojsonify(filings), HTTPStatus.OK
 
     @staticmethod
     @cors.crossdomain(origin='*')
@@ -740,7 +774,7 @@ class InternalFilings(Resource):
         # check authorization
         try:
             if not jwt.validate_roles([COLIN_SVC_ROLE]):
-                return jsonify({'message': 'You are not authorized to update the colin id'}), HTTPStatus.UNAUTHORIZED
+                return ojsonify({'message': 'You are not authorized to update the colin id'}), HTTPStatus.UNAUTHORIZED
 
             json_input = request.get_json()
             if not json_input:
@@ -761,7 +795,7 @@ class InternalFilings(Resource):
                     current_app.logger.Error(f'Error adding colin event id {colin_id} to filing with id {filing_id}')
                     return None, None, {'message': err.error}, err.status_code
 
-            return jsonify(filing.json), HTTPStatus.ACCEPTED
+            return ojsonify(filing.json), HTTPStatus.ACCEPTED
         except Exception as err:
             current_app.logger.Error(f'Error patching colin event id for filing with id {filing_id}')
             raise err
@@ -787,12 +821,7 @@ class ColinLastUpdate(Resource):
             current_app.logger.Error(f'Failed to get last updated colin event id: {err}')
             raise err
 
-        query = db.session.execute(
-            """
-            select last_event_id from colin_last_update
-            order by id desc
-            """
-        )
+        query = db.session.execute(LAST_COLIN_EVENT_ID_SQL)
         last_event_id = query.fetchone()
         if not last_event_id or not last_event_id[0]:
             return {'message': 'No colin ids found'}, HTTPStatus.NOT_FOUND
@@ -807,13 +836,8 @@ class ColinLastUpdate(Resource):
         try:
             # check authorization
             if not jwt.validate_roles([COLIN_SVC_ROLE]):
-                return jsonify({'message': 'You are not authorized to update this table'}), HTTPStatus.UNAUTHORIZED
-            db.session.execute(
-                f"""
-                insert into colin_last_update (last_update, last_event_id)
-                values (current_timestamp, {colin_id})
-                """
-            )
+                return ojsonify({'message': 'You are not authorized to update this table'}), HTTPStatus.UNAUTHORIZED
+            db.session.execute(INSERT_COLIN_LAST_UPDATE_SQL, {'colin_id': colin_id})
             db.session.commit()
             return ColinLastUpdate.get()
 
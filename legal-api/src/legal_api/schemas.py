@@ -13,9 +13,73 @@
 # limitations under the License.
 
 """Create the schema manager to be initialized inThe flask create_app."""
+from itertools import chain
+from os import path
+from typing import Dict, Tuple
+
+import registry_schemas
+from jsonschema import Draft7Validator, RefResolver, draft7_format_checker
 from registry_schemas.flask import SchemaServices
+from registry_schemas.utils import BASE_URI, get_schema_store
+
+
+SCHEMA_SEARCH_PATH = path.join(path.dirname(registry_schemas.__file__), 'schemas')
+PRECOMPILED_SCHEMAS = ('filing', 'comment')
+
+
+class CachedSchemaServices(SchemaServices):
+    """Schema services that load the schema store and schemas once and reuse them.
+
+    The registry_schemas validate reloads the schema store from disk on every call.
+    """
+
+    def __init__(self, app=None):
+        """Initialize this object."""
+        self._store = None
+        self._schemas: Dict[str, dict] = {}
+        super().__init__(app)
+
+    def init_app(self, app):
+        """Initialize the extension and load the schemas used by the api."""
+        super().init_app(app)
+        self.precompile()
+
+    def precompile(self, schema_ids: Tuple[str] = PRECOMPILED_SCHEMAS):
+        """Load and check the schemas up front, so an invalid schema fails at startup not on a request."""
+        for schema_id in schema_ids:
+            Draft7Validator.check_schema(self.get_schema(schema_id))
+
+    def get_schema(self, schema_id: str) -> dict:
+        """Return the cached schema, loading the schema store on first use."""
+        schema = self._schemas.get(schema_id)
+        if not schema:
+            if not self._store:
+                self._store = get_schema_store()
+            schema = self._store.get(f'{BASE_URI}/{schema_id}')
+            self._schemas[schema_id] = schema
+        return schema
+
+    def get_validator(self, schema_id: str) -> Draft7Validator:
+        """Return a validator for the cached schema.
+
+        The RefResolver tracks the $ref scopes while validating, so each validation gets its own
+        rather than sharing one between request threads.
+        """
+        schema = self.get_schema(schema_id)
+        resolver = RefResolver(f'file://{path.join(SCHEMA_SEARCH_PATH, schema_id)}.json',
+                               schema,
+                               self._store)
+        return Draft7Validator(schema, format_checker=draft7_format_checker, resolver=resolver)
+
+    def validate(self, json_data: Dict, schema_id: str) -> Tuple[bool, iter]:
+        """Validate the json against the schema, returning (valid, errors) like registry_schemas."""
+        errors = self.get_validator(schema_id).iter_errors(json_data)
+        # stop at the first error to decide validity, then hand back the rest of the same walk
+        if (first := next(errors, None)) is None:
+            return True, None
+        return False, chain((first,), errors)
 
 
-rsbc_schemas = SchemaServices()  # pylint: disable=invalid-name
+rsbc_schemas = CachedSchemaServices()  # pylint: disable=invalid-name
 
 __all__ = ('rsbc_schemas')
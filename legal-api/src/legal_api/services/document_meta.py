@@ -38,14 +38,15 @@ class DocumentMetaService():
         NOTICE_OF_ARTICLES = 'noa'
         ALTERATION_NOTICE = 'alterationNotice'
 
-    def __init__(self):
-        """Create the document meta instance."""
+    def __init__(self, business: Business = None):
+        """Create the document meta instance, optionally with the already loaded business for the filings."""
         # init global attributes
         self._business_identifier = None
         self._legal_type = None
         self._filing_status = None
         self._filing_id = None
         self._filing_date = None
+        self._businesses = {business.identifier: business} if business else {}
 
     def get_documents(self, filing: dict):
         """Return an array of document meta for a filing."""
@@ -55,7 +56,10 @@ class DocumentMetaService():
         if self._business_identifier.startswith('T'):
             self._legal_type = filing['filing']['incorporationApplication']['nameRequest']['legalType']
         else:
-            business = Business.find_by_identifier(self._business_identifier)
+            # cache the business so a list of filings for the same business only looks it up once
+            if self._business_identifier not in self._businesses:
+                self._businesses[self._business_identifier] = Business.find_by_identifier(self._business_identifier)
+            business = self._businesses[self._business_identifier]
             if not business:
                 return []  # business not found
             self._legal_type = business.legal_type
@@ -30,7 +30,28 @@ from .special_resolution import validate as special_resolution_validate
 from .voluntary_dissolution import validate as voluntary_dissolution_validate
 
 
-def validate(business: Business, filing_json: Dict) -> Error:  # pylint: disable=too-many-branches
+# validators by filing name, each called as validator(business, filing_json)
+VALIDATORS = {
+    Filing.FILINGS['annualReport'].get('name'): annual_report_validate,
+    Filing.FILINGS['changeOfAddress'].get('name'): coa_validate,
+    Filing.FILINGS['changeOfDirectors'].get('name'): cod_validate,
+    Filing.FILINGS['changeOfName'].get('name'): con_validate,
+    Filing.FILINGS['specialResolution'].get('name'): special_resolution_validate,
+    Filing.FILINGS['voluntaryDissolution'].get('name'): voluntary_dissolution_validate,
+    Filing.FILINGS['incorporationApplication'].get('name'):
+        lambda business, filing_json: incorporation_application_validate(filing_json),
+    Filing.FILINGS['alteration'].get('name'): alteration_validate
+}
+
+# validators by filing name for the filings within a correction
+CORRECTION_VALIDATORS = {
+    Filing.FILINGS['changeOfAddress'].get('name'): coa_validate,
+    Filing.FILINGS['incorporationApplication'].get('name'):
+        lambda business, filing_json: validate_correction_ia(filing_json)
+}
+
+
+def validate(business: Business, filing_json: Dict) -> Error:
     """Validate the filing JSON."""
     err = validate_against_schema(filing_json)
     if err:
@@ -48,50 +69,17 @@ def validate(business: Business, filing_json: Dict) -> Error:  # pylint: disable
         # For now the correction validators will get called here, these might be the same rules
         # so these 2 sections could get collapsed
         for k in filing_json['filing'].keys():
-            # Check if the JSON key exists in the FILINGS reference Dictionary
-            if Filing.FILINGS.get(k, None):
-
-                if k == Filing.FILINGS['changeOfAddress'].get('name'):
-                    err = coa_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['incorporationApplication'].get('name'):
-                    err = validate_correction_ia(filing_json)
+            if validator := CORRECTION_VALIDATORS.get(k):
+                err = validator(business, filing_json)
 
         if err:
             return err
 
     else:
         for k in filing_json['filing'].keys():
-            # Check if the JSON key exists in the FILINGS reference Dictionary
-            if Filing.FILINGS.get(k, None):
-                # The type of this Filing exists in the JSON, determine which
-                # one it is (Annual Report, Change of Address, or Change of Directors)
-                # and validate against the appropriate logic
-
-                if k == Filing.FILINGS['annualReport'].get('name'):
-                    err = annual_report_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['changeOfAddress'].get('name'):
-                    err = coa_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['changeOfDirectors'].get('name'):
-                    err = cod_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['changeOfName'].get('name'):
-                    err = con_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['specialResolution'].get('name'):
-                    err = special_resolution_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['voluntaryDissolution'].get('name'):
-                    err = voluntary_dissolution_validate(business, filing_json)
-
-                elif k == Filing.FILINGS['incorporationApplication'].get('name'):
-                    err = incorporation_application_validate(filing_json)
-
-                elif k == Filing.FILINGS['alteration'].get('name'):
-                    err = alteration_validate(business, filing_json)
-
+            # The type of this Filing exists in the JSON, validate it against the appropriate logic
+            if validator := VALIDATORS.get(k):
+                err = validator(business, filing_json)
                 if err:
                     return err
 
@@ -15,8 +15,9 @@
 import copy
 from http import HTTPStatus
 
-from registry_schemas.example_data import ANNUAL_REPORT
+from registry_schemas.example_data import ANNUAL_REPORT, CHANGE_OF_ADDRESS, FILING_HEADER
 
+from legal_api.schemas import PRECOMPILED_SCHEMAS, rsbc_schemas
 from legal_api.services.filings.validations import schemas
 
 
@@ -40,3 +41,26 @@ def test_validate_schema_bad_ar(app):
 
     assert err.msg == [{'error': "'name' is a required property", 'path': 'filing/header'}]
     assert err.code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_validate_schema_reuses_schema(app):
+    """Assert that different filings validate back to back against the cached schema."""
+    coa = copy.deepcopy(FILING_HEADER)
+    coa['filing']['header']['name'] = 'changeOfAddress'
+    coa['filing']['changeOfAddress'] = CHANGE_OF_ADDRESS
+
+    with app.app_context():
+        schema = rsbc_schemas.get_schema('filing')
+        assert not schemas.validate_against_schema(ANNUAL_REPORT)
+        assert not schemas.validate_against_schema(coa)
+        assert not schemas.validate_against_schema(ANNUAL_REPORT)
+
+        assert rsbc_schemas.get_schema('filing') is schema
+        # each validation gets its own resolver, they hold per validation $ref state
+        assert rsbc_schemas.get_validator('filing').resolver is not rsbc_schemas.get_validator('filing').resolver
+
+
+def test_schemas_loaded_at_startup(app):
+    """Assert that the app factory has already loaded the schemas used by the api."""
+    for schema_id in PRECOMPILED_SCHEMAS:
+        assert schema_id in rsbc_schemas._schemas  # pylint: disable=protected-access
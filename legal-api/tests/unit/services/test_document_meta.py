@@ -89,6 +89,37 @@ def test_wrong_filing_status(session, app):
         assert document_meta._legal_type == Business.LegalTypes.BCOMP.value
 
 
+def test_business_looked_up_once(session, app):
+    """Assert that the business is only looked up once per identifier, or not at all when provided."""
+    business = factory_business(identifier='BC1234567', entity_type=Business.LegalTypes.BCOMP.value)
+    with app.app_context():
+        filing = {
+            'filing': {
+                'header': {
+                    'filingId': 12356,
+                    'status': 'NOT_PAID_OR_COMPLETE',
+                    'name': 'changeOfAddress',
+                    'availableOnPaperOnly': False,
+                    'date': FILING_DATE
+                },
+                'business': {
+                    'identifier': 'BC1234567'
+                }
+            }
+        }
+        with patch.object(Business, 'find_by_identifier', return_value=business) as mock_find:
+            document_meta = DocumentMetaService()
+            document_meta.get_documents(filing)
+            document_meta.get_documents(filing)
+            assert mock_find.call_count == 1
+
+            mock_find.reset_mock()
+            document_meta = DocumentMetaService(business)
+            document_meta.get_documents(filing)
+            assert document_meta._legal_type == Business.LegalTypes.BCOMP.value
+            mock_find.assert_not_called()
+
+
 def test_available_on_paper_only(session, app):
     """Assert that no documents are returned for a paper-only filing."""
     document_meta = DocumentMetaService()
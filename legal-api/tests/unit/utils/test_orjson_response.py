@@ -0,0 +1,46 @@
+# Copyright © 2021 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to ensure the orjson responses match what flask.jsonify returns."""
+from decimal import Decimal
+
+import pytest
+
+from legal_api.utils.orjson_response import ojsonify
+
+
+@pytest.mark.parametrize('args, kwargs, expected', [
+    (({'filings': []},), {}, {'filings': []}),
+    ((), {'filings': [{'filing': {'header': {'name': 'annualReport'}}}]},
+     {'filings': [{'filing': {'header': {'name': 'annualReport'}}}]}),
+    (([1, 2],), {}, [1, 2]),
+    ((1, 2), {}, [1, 2]),
+    (({'amount': Decimal('1.50')},), {}, {'amount': '1.50'}),
+    (({1: 'one', 2: 'two'},), {}, {'1': 'one', '2': 'two'}),
+])
+def test_ojsonify(app, args, kwargs, expected):
+    """Assert that ojsonify accepts the same arguments as jsonify and returns a json response."""
+    with app.app_context():
+        rv = ojsonify(*args, **kwargs)
+
+    assert rv.mimetype == 'application/json'
+    assert rv.status_code == 200
+    assert rv.json == expected
+
+
+def test_ojsonify_args_and_kwargs(app):
+    """Assert that passing both args and kwargs is rejected, like jsonify."""
+    with app.app_context():
+        with pytest.raises(TypeError):
+            ojsonify({'a': 1}, b=2)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The Test Suites to ensure that the worker is operating correctly."""
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
 import pytest
 from legal_api.models import Business
@@ -23,6 +23,20 @@ from entity_emailer.email_processors import filing_notification
 from tests.unit import prep_incorp_filing, prep_maintenance_filing
 
 
+TOKEN = '1'
+
+
+@pytest.fixture
+def email_mocks():
+    """Patch the token, pdf and send calls made by the worker, yielding the mocks by patched name."""
+    with patch.object(AccountService, 'get_bearer_token', return_value=TOKEN), \
+            patch.multiple(filing_notification, _get_pdfs=DEFAULT) as notification_mocks, \
+            patch.multiple(worker, send_email=DEFAULT) as worker_mocks:
+        notification_mocks['_get_pdfs'].return_value = []
+        worker_mocks['send_email'].return_value = 'success'
+        yield {**notification_mocks, **worker_mocks}
+
+
 def test_process_filing_missing_app(app, session):
     """Assert that an email will fail with no flask app supplied."""
     # setup
@@ -36,35 +50,33 @@ def test_process_filing_missing_app(app, session):
 @pytest.mark.parametrize('option', [
     ('PAID'),
     ('COMPLETED'),
-])
-def test_process_incorp_email(app, session, option):
+], ids=['paid', 'completed'])
+def test_process_incorp_email(app, session, email_mocks, option):
     """Assert that an INCORP email msg is processed correctly."""
     # setup filing + business for email
     filing = prep_incorp_filing(session, 'BC1234567', '1', option)
-    token = '1'
+    mock_get_pdfs = email_mocks['_get_pdfs']
+    mock_send_email = email_mocks['send_email']
     # test worker
-    with patch.object(AccountService, 'get_bearer_token', return_value=token):
-        with patch.object(filing_notification, '_get_pdfs', return_value=[]) as mock_get_pdfs:
-            with patch.object(worker, 'send_email', return_value='success') as mock_send_email:
-                worker.process_email(
-                    {'email': {'filingId': filing.id, 'type': 'incorporationApplication', 'option': option}}, app)
-
-                assert mock_get_pdfs.call_args[0][0] == option
-                assert mock_get_pdfs.call_args[0][1] == token
-                assert mock_get_pdfs.call_args[0][2] == {'identifier': 'BC1234567'}
-                assert mock_get_pdfs.call_args[0][3] == filing
-
-                if option == 'PAID':
-                    assert 'comp_party@email.com' in mock_send_email.call_args[0][0]['recipients']
-                    assert mock_send_email.call_args[0][0]['content']['subject'] == \
-                        'Confirmation of Filing from the Business Registry'
-                else:
-                    assert mock_send_email.call_args[0][0]['content']['subject'] == \
-                        'Incorporation Documents from the Business Registry'
-                assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
-                assert mock_send_email.call_args[0][0]['content']['body']
-                assert mock_send_email.call_args[0][0]['content']['attachments'] == []
-                assert mock_send_email.call_args[0][1] == token
+    worker.process_email(
+        {'email': {'filingId': filing.id, 'type': 'incorporationApplication', 'option': option}}, app)
+
+    assert mock_get_pdfs.call_args[0][0] == option
+    assert mock_get_pdfs.call_args[0][1] == TOKEN
+    assert mock_get_pdfs.call_args[0][2] == {'identifier': 'BC1234567'}
+    assert mock_get_pdfs.call_args[0][3] == filing
+
+    if option == 'PAID':
+        assert 'comp_party@email.com' in mock_send_email.call_args[0][0]['recipients']
+        assert mock_send_email.call_args[0][0]['content']['subject'] == \
+            'Confirmation of Filing from the Business Registry'
+    else:
+        assert mock_send_email.call_args[0][0]['content']['subject'] == \
+            'Incorporation Documents from the Business Registry'
+    assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
+    assert mock_send_email.call_args[0][0]['content']['body']
+    assert mock_send_email.call_args[0][0]['content']['attachments'] == []
+    assert mock_send_email.call_args[0][1] == TOKEN
 
 
 @pytest.mark.parametrize(['status', 'filing_type'], [
@@ -73,39 +85,36 @@ def test_process_incorp_email(app, session, option):
     ('PAID', 'changeOfDirectors'),
     ('COMPLETED', 'changeOfAddress'),
     ('COMPLETED', 'changeOfDirectors')
-])
-def test_maintenance_notification(app, session, status, filing_type):
+], ids=['paid-ar', 'paid-coa', 'paid-cod', 'completed-coa', 'completed-cod'])
+def test_maintenance_notification(app, session, email_mocks, status, filing_type):
     """Assert that the legal name is changed."""
     # setup filing + business for email
     filing = prep_maintenance_filing(session, 'BC1234567', '1', status, filing_type)
-    token = 'token'
+    mock_get_pdfs = email_mocks['_get_pdfs']
+    mock_send_email = email_mocks['send_email']
     # test worker
-    with patch.object(AccountService, 'get_bearer_token', return_value=token):
-        with patch.object(filing_notification, '_get_pdfs', return_value=[]) as mock_get_pdfs:
-            with patch.object(filing_notification, 'get_recipients', return_value='test@test.com') \
-              as mock_get_recipients:
-                with patch.object(worker, 'send_email', return_value='success') as mock_send_email:
-                    worker.process_email(
-                        {'email': {'filingId': filing.id, 'type': f'{filing_type}', 'option': status}}, app)
-
-                    assert mock_get_pdfs.call_args[0][0] == status
-                    assert mock_get_pdfs.call_args[0][1] == token
-                    assert mock_get_pdfs.call_args[0][2] == \
-                        {
-                            'identifier': 'BC1234567',
-                            'legalype': Business.LegalTypes.BCOMP.value,
-                            'legalName': 'test business'
-                        }
-                    assert mock_get_pdfs.call_args[0][3] == filing
-                    assert mock_get_recipients.call_args[0][0] == status
-                    assert mock_get_recipients.call_args[0][1] == filing.filing_json
-                    assert mock_get_recipients.call_args[0][2] == token
-
-                    assert mock_send_email.call_args[0][0]['content']['subject']
-                    assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
-                    assert mock_send_email.call_args[0][0]['content']['body']
-                    assert mock_send_email.call_args[0][0]['content']['attachments'] == []
-                    assert mock_send_email.call_args[0][1] == token
+    with patch.object(filing_notification, 'get_recipients', return_value='test@test.com') as mock_get_recipients:
+        worker.process_email(
+            {'email': {'filingId': filing.id, 'type': f'{filing_type}', 'option': status}}, app)
+
+    assert mock_get_pdfs.call_args[0][0] == status
+    assert mock_get_pdfs.call_args[0][1] == TOKEN
+    assert mock_get_pdfs.call_args[0][2] == \
+        {
+            'identifier': 'BC1234567',
+            'legalype': Business.LegalTypes.BCOMP.value,
+            'legalName': 'test business'
+        }
+    assert mock_get_pdfs.call_args[0][3] == filing
+    assert mock_get_recipients.call_args[0][0] == status
+    assert mock_get_recipients.call_args[0][1] == filing.filing_json
+    assert mock_get_recipients.call_args[0][2] == TOKEN
+
+    assert mock_send_email.call_args[0][0]['content']['subject']
+    assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
+    assert mock_send_email.call_args[0][0]['content']['body']
+    assert mock_send_email.call_args[0][0]['content']['attachments'] == []
+    assert mock_send_email.call_args[0][1] == TOKEN
 
 
 @pytest.mark.parametrize(['status', 'filing_type', 'identifier'], [
@@ -114,62 +123,54 @@ def test_maintenance_notification(app, session, status, filing_type):
     ('PAID', 'changeOfDirectors', 'CP1234567'),
     ('COMPLETED', 'changeOfAddress', 'CP1234567'),
     ('COMPLETED', 'changeOfDirectors', 'CP1234567')
-])
-def test_skips_notification(app, session, status, filing_type, identifier):
+], ids=['completed-ar-bc', 'paid-coa-cp', 'paid-cod-cp', 'completed-coa-cp', 'completed-cod-cp'])
+def test_skips_notification(app, session, email_mocks, status, filing_type, identifier):
     """Assert that the legal name is changed."""
     # setup filing + business for email
     filing = prep_maintenance_filing(session, identifier, '1', status, filing_type)
-    token = 'token'
     # test processor
-    with patch.object(AccountService, 'get_bearer_token', return_value=token):
-        with patch.object(filing_notification, '_get_pdfs', return_value=[]):
-            with patch.object(worker, 'send_email', return_value='success') as mock_send_email:
-                worker.process_email(
-                    {'email': {'filingId': filing.id, 'type': f'{filing_type}', 'option': status}}, app)
+    worker.process_email(
+        {'email': {'filingId': filing.id, 'type': f'{filing_type}', 'option': status}}, app)
 
-                assert not mock_send_email.call_args
+    assert not email_mocks['send_email'].call_args
 
 
-def test_process_mras_email(app, session):
+def test_process_mras_email(app, session, email_mocks):
     """Assert that an MRAS email msg is processed correctly."""
     # setup filing + business for email
     filing = prep_incorp_filing(session, 'BC1234567', '1', 'mras')
-    token = '1'
+    mock_send_email = email_mocks['send_email']
     # run worker
-    with patch.object(AccountService, 'get_bearer_token', return_value=token):
-        with patch.object(worker, 'send_email', return_value='success') as mock_send_email:
-            worker.process_email(
-                {'email': {'filingId': filing.id, 'type': 'incorporationApplication', 'option': 'mras'}}, app)
+    worker.process_email(
+        {'email': {'filingId': filing.id, 'type': 'incorporationApplication', 'option': 'mras'}}, app)
 
-            # check vals
-            assert mock_send_email.call_args[0][0]['content']['subject'] == 'BC Business Registry Partner Information'
-            assert mock_send_email.call_args[0][0]['recipients'] == 'test@test.com'
-            assert mock_send_email.call_args[0][0]['content']['body']
-            assert mock_send_email.call_args[0][0]['content']['attachments'] == []
-            assert mock_send_email.call_args[0][1] == token
+    # check vals
+    assert mock_send_email.call_args[0][0]['content']['subject'] == 'BC Business Registry Partner Information'
+    assert mock_send_email.call_args[0][0]['recipients'] == 'test@test.com'
+    assert mock_send_email.call_args[0][0]['content']['body']
+    assert mock_send_email.call_args[0][0]['content']['attachments'] == []
+    assert mock_send_email.call_args[0][1] == TOKEN
 
 
-def test_process_bn_email(app, session):
+def test_process_bn_email(app, session, email_mocks):
     """Assert that a BN email msg is processed correctly."""
     # setup filing + business for email
     identifier = 'BC1234567'
     filing = prep_incorp_filing(session, identifier, '1', 'bn')
     business = Business.find_by_identifier(identifier)
+    mock_send_email = email_mocks['send_email']
     # sanity check
     assert filing.id
     assert business.id
-    token = '1'
     # run worker
-    with patch.object(AccountService, 'get_bearer_token', return_value=token):
-        with patch.object(worker, 'send_email', return_value='success') as mock_send_email:
-            worker.process_email(
-                {'email': {'filingId': None, 'type': 'businessNumber', 'option': 'bn', 'identifier': 'BC1234567'}},
-                app
-            )
-            # check email values
-            assert 'comp_party@email.com' in mock_send_email.call_args[0][0]['recipients']
-            assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
-            assert mock_send_email.call_args[0][0]['content']['subject'] == \
-                f'{business.legal_name} - Business Number Information'
-            assert mock_send_email.call_args[0][0]['content']['body']
-            assert mock_send_email.call_args[0][0]['content']['attachments'] == []
+    worker.process_email(
+        {'email': {'filingId': None, 'type': 'businessNumber', 'option': 'bn', 'identifier': 'BC1234567'}},
+        app
+    )
+    # check email values
+    assert 'comp_party@email.com' in mock_send_email.call_args[0][0]['recipients']
+    assert 'test@test.com' in mock_send_email.call_args[0][0]['recipients']
+    assert mock_send_email.call_args[0][0]['content']['subject'] == \
+        f'{business.legal_name} - Business Number Information'
+    assert mock_send_email.call_args[0][0]['content']['body']
+    assert mock_send_email.call_args[0][0]['content']['attachments'] == []